@@ -26,6 +26,20 @@ from pandas_ta.utils import *
 
 
 df = pd.DataFrame()
+_mp_ta = None
+
+
+def _mp_init(ta) -> None:
+    """Multiprocessing Pool initializer. Keeps a copy of the 'ta' extension
+    in each worker so the DataFrame is sent once per worker, not per task."""
+    global _mp_ta
+    _mp_ta = ta
+
+
+def _mp_task(arguments: tuple):
+    """Multiprocessing task. Runs on the worker's copy of the 'ta' extension."""
+    return _mp_ta._mp_worker(arguments)
+
 
 # Strategy DataClass
 @dataclass
@@ -250,11 +264,13 @@ class AnalysisIndicators(BasePandasObject):
     _exchange = "NYSE"
     _time_range = "years"
     _last_run = get_time(_exchange, to_string=True)
+    _ta_indicators = None # Cached by indicators(). Reset when binding custom indicators
 
     def __init__(self, pandas_obj):
         self._validate(pandas_obj)
         self._df = pandas_obj
         self._last_run = get_time(self._exchange, to_string=True)
+        self._matched_columns = {}
 
     @staticmethod
     def _validate(obj: Tuple[pd.DataFrame, pd.Series]):
@@ -267,28 +283,28 @@ class AnalysisIndicators(BasePandasObject):
             timed: bool = False, version: bool = False, **kwargs
         ):
         if version: print(f"Pandas TA - Technical Analysis Indicators - v{self.version}")
-        try:
-            if isinstance(kind, str):
-                kind = kind.lower()
-                fn = getattr(self, kind)
+        if not isinstance(kind, str):
+            if not version: self.indicators()
+            return
 
-                if timed:
-                    stime = perf_counter()
+        kind = kind.lower()
+        fn = getattr(self, kind, None)
+        if kind.startswith("_") or not callable(fn):
+            print(f"[X] '{kind}' is not an indicator. See: df.ta.indicators()")
+            return
 
-                # Run the indicator
-                result = fn(**kwargs)  # = getattr(self, kind)(**kwargs)
-                self._last_run = get_time(self.exchange, to_string=True) # Save when it completed it's run
+        if timed:
+            stime = perf_counter()
 
-                if timed:
-                    result.timed = final_time(stime)
-                    print(f"[+] {kind}: {result.timed}")
+        # Run the indicator
+        result = fn(**kwargs)  # = getattr(self, kind)(**kwargs)
+        self._last_run = get_time(self.exchange, to_string=True) # Save when it completed it's run
 
-                return result
-            else:
-                self.help()
+        if timed:
+            result.timed = final_time(stime)
+            print(f"[+] {kind}: {result.timed}")
 
-        except BaseException:
-            pass
+        return result
 
     # Public Get/Set DataFrame Properties
     @property
@@ -410,14 +426,15 @@ class AnalysisIndicators(BasePandasObject):
                     # If not, use the default names.
                     if "col_names" in kwargs and isinstance(kwargs["col_names"], tuple):
                         if len(kwargs["col_names"]) >= len(result.columns):
-                            for col, ind_name in zip(result.columns, kwargs["col_names"]):
-                                df[ind_name] = result.loc[:, col]
+                            ind_names = list(kwargs["col_names"][:len(result.columns)])
                         else:
                             print(f"Not enough col_names were specified : got {len(kwargs['col_names'])}, expected {len(result.columns)}.")
                             return
                     else:
-                        for i, column in enumerate(result.columns):
-                            df[column] = result.iloc[:, i]
+                        ind_names = list(result.columns)
+                    # Assign column by column, by position, so repeated labels work
+                    for i, ind_name in enumerate(ind_names):
+                        df[ind_name] = result.iloc[:, i]
                 else:
                     ind_name = (
                         kwargs["col_names"][0] if "col_names" in kwargs and
@@ -445,15 +462,21 @@ class AnalysisIndicators(BasePandasObject):
             # Return the df column since it's in there.
             if series in df.columns:
                 return df[series]
+            # Reuse a previous match if that column still exists.
+            matched = self._matched_columns.get(series)
+            if matched is not None and matched in df.columns:
+                return df[matched]
             else:
                 # Attempt to match the 'series' because it was likely
                 # misspelled.
                 matches = df.columns.str.match(series, case=False)
                 match = [i for i, x in enumerate(matches) if x]
                 # If found, awesome.  Return it or return the 'series'.
+                if len(match):
+                    self._matched_columns[series] = df.columns[match[0]]
+                    return df.iloc[:, match[0]]
                 cols = ", ".join(list(df.columns))
-                NOT_FOUND = f"[X] Ooops!!! It's {series not in df.columns}, the series '{series}' was not found in {cols}"
-                return df.iloc[:, match[0]] if len(match) else print(NOT_FOUND)
+                print(f"[X] Ooops!!! It's {series not in df.columns}, the series '{series}' was not found in {cols}")
 
     def _indicators_by_category(self, name: str) -> list:
         """Returns indicators by Categorical name."""
@@ -567,36 +590,37 @@ class AnalysisIndicators(BasePandasObject):
             Prints the list of indicators. If as_list=True, then a list.
         """
         as_list = kwargs.setdefault("as_list", False)
-        # Public non-indicator methods
-        helper_methods = ["constants", "indicators", "strategy"]
-        # Public df.ta.properties
-        ta_properties = [
-            "adjusted",
-            "categories",
-            "cores",
-            "datetime_ordered",
-            "exchange",
-            "last_run",
-            "reverse",
-            "ticker",
-            "time_range",
-            "to_utc",
-            "version",
-        ]
-
-        # Public non-indicator methods
-        ta_indicators = list((x for x in dir(pd.DataFrame().ta) if not x.startswith("_") and not x.endswith("_")))
-
-        # Add Pandas TA methods and properties to be removed
-        removed = helper_methods + ta_properties
-
-        # Add user excluded methods to be removed
+        if AnalysisIndicators._ta_indicators is None:
+            # Public non-indicator methods
+            helper_methods = ["constants", "indicators", "strategy"]
+            # Public df.ta.properties
+            ta_properties = [
+                "adjusted",
+                "categories",
+                "cores",
+                "datetime_ordered",
+                "exchange",
+                "last_run",
+                "reverse",
+                "ticker",
+                "time_range",
+                "to_utc",
+                "version",
+            ]
+            removed = helper_methods + ta_properties
+
+            # Public indicator methods
+            AnalysisIndicators._ta_indicators = tuple(
+                x for x in dir(AnalysisIndicators)
+                if not x.startswith("_") and not x.endswith("_") and x not in removed
+            )
+
+        # Remove user excluded indicators
         user_excluded = kwargs.setdefault("exclude", [])
         if isinstance(user_excluded, list) and len(user_excluded) > 0:
-            removed += user_excluded
-
-        # Remove the unwanted indicators
-        [ta_indicators.remove(x) for x in removed]
+            ta_indicators = [x for x in self._ta_indicators if x not in user_excluded]
+        else:
+            ta_indicators = list(self._ta_indicators)
 
         # If as a list, immediately return
         if as_list:
@@ -654,6 +678,7 @@ class AnalysisIndicators(BasePandasObject):
             # "data", # reserved
             "long_run",
             "short_run",
+            "ssf_batch",
             "td_seq", # Performance exclusion
             "tsignals",
             "vp",
@@ -722,7 +747,7 @@ class AnalysisIndicators(BasePandasObject):
 
         if use_multiprocessing:
             _total_ta = len(ta)
-            with Pool(self.cores) as pool:
+            with Pool(self.cores, initializer=_mp_init, initargs=(self,)) as pool:
                 # Some magic to optimize chunksize for speed based on total ta indicators
                 _chunksize = mp_chunksize - 1 if mp_chunksize > _total_ta else int(npLog10(_total_ta)) + 1
                 if verbose:
@@ -738,20 +763,20 @@ class AnalysisIndicators(BasePandasObject):
                     ) for ind in ta]
                     # Custom multiprocessing pool. Must be ordered for Chained Strategies
                     # May fix this to cpus if Chaining/Composition if it remains
-                    results = pool.imap(self._mp_worker, custom_ta, _chunksize)
+                    results = pool.imap(_mp_task, custom_ta, _chunksize)
                 else:
                     default_ta = [(ind, tuple(), kwargs) for ind in ta]
                     # All and Categorical multiprocessing pool.
                     if all_ordered:
                         if Imports["tqdm"]:
-                            results = tqdm(pool.imap(self._mp_worker, default_ta, _chunksize)) # Order over Speed
+                            results = tqdm(pool.imap(_mp_task, default_ta, _chunksize)) # Order over Speed
                         else:
-                            results = pool.imap(self._mp_worker, default_ta, _chunksize) # Order over Speed
+                            results = pool.imap(_mp_task, default_ta, _chunksize) # Order over Speed
                     else:
                         if Imports["tqdm"]:
-                            results = tqdm(pool.imap_unordered(self._mp_worker, default_ta, _chunksize)) # Speed over Order
+                            results = tqdm(pool.imap_unordered(_mp_task, default_ta, _chunksize)) # Speed over Order
                         else:
-                            results = pool.imap_unordered(self._mp_worker, default_ta, _chunksize) # Speed over Order
+                            results = pool.imap_unordered(_mp_task, default_ta, _chunksize) # Speed over Order
                 if results is None:
                     print(f"[X] ta.strategy('{name}') has no results.")
                     return
@@ -1269,6 +1294,16 @@ class AnalysisIndicators(BasePandasObject):
         result = ssf(close=close, length=length, poles=poles, offset=offset, **kwargs)
         return self._post_process(result, **kwargs)
 
+    def ssf_batch(self, columns=None, length=None, poles=None, offset=None, **kwargs):
+        columns = columns if isinstance(columns, list) and len(columns) > 0 else ["close"]
+        # Missing columns are reported by _get_column and skipped
+        closes = [c for c in map(self._get_column, columns) if c is not None]
+        if len(closes) == 0: return self._post_process(None, **kwargs)
+
+        closes = pd.concat(closes, axis=1)
+        result = ssf_batch(closes=closes, length=length, poles=poles, offset=offset, **kwargs)
+        return self._post_process(result, **kwargs)
+
     def supertrend(self, length=None, multiplier=None, offset=None, **kwargs):
         high = self._get_column(kwargs.pop("high", "high"))
         low = self._get_column(kwargs.pop("low", "low"))
@@ -23,6 +23,7 @@ def bind(function_name, function, method):
     """
     setattr(pandas_ta, function_name, function)
     setattr(AnalysisIndicators, function_name, method)
+    AnalysisIndicators._ta_indicators = None
 
 
 def create_dir(path, create_categories=True, verbose=True):
@@ -30,8 +30,8 @@ def dm(high, low, length=None, mamode=None, talib=None, drift=None, offset=None,
         pos_ = ((up > dn) & (up > 0)) * up
         neg_ = ((dn > up) & (dn > 0)) * dn
 
-        pos_ = pos_.apply(zero)
-        neg_ = neg_.apply(zero)
+        pos_ = zero(pos_)
+        neg_ = zero(neg_)
 
         # Not the same values as TA Lib's -+DM (Good First Issue)
         pos = ma(mamode, pos_, length=length)
@@ -77,8 +77,8 @@ Calculation:
         pos_ = ((up > dn) & (up > 0)) * up
         neg_ = ((dn > up) & (dn > 0)) * dn
 
-        pos_ = pos_.apply(zero)
-        neg_ = neg_.apply(zero)
+        pos_ = zero(pos_)
+        neg_ = zero(neg_)
 
         # Not the same values as TA Lib's -+DM
         pos = ma(mamode, pos_, length=length)
@@ -21,7 +21,7 @@ from .pwma import pwma
 from .rma import rma
 from .sinwma import sinwma
 from .sma import sma
-from .ssf import ssf
+from .ssf import ssf, ssf_batch
 from .supertrend import supertrend
 from .swma import swma
 from .t3 import t3
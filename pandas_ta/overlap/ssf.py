@@ -1,9 +1,90 @@
 # -*- coding: utf-8 -*-
+from functools import lru_cache
+from numpy import ascontiguousarray as npAscontiguousarray
 from numpy import cos as npCos
+from numpy import empty_like as npEmptyLike
 from numpy import exp as npExp
 from numpy import pi as npPi
 from numpy import sqrt as npSqrt
+from pandas import DataFrame, Series
 from pandas_ta.utils import get_offset, verify_series
+from pandas_ta.utils._njit import njit
+
+
+@njit(cache=True)
+def _ssf2_loop(x, c1, b1, a1):
+    """Two pole SSF recurrence over a float64 ndarray. The first two values
+    seed the filter with the input."""
+    m = x.size
+    result = npEmptyLike(x)
+    result[:2] = x[:2]
+    if m > 2:
+        # Keep the prior filter values in locals rather than re-reading them
+        s1, s2 = x[1], x[0]
+        for i in range(2, m):
+            s0 = c1 * x[i] + b1 * s1 + a1 * s2
+            result[i] = s0
+            s1, s2 = s0, s1
+    return result
+
+
+@njit(cache=True)
+def _ssf3_loop(x, c1, c2, c3, c4):
+    """Three pole SSF recurrence over a float64 ndarray. The first three
+    values seed the filter with the input."""
+    m = x.size
+    result = npEmptyLike(x)
+    result[:3] = x[:3]
+    if m > 3:
+        # Keep the prior filter values in locals rather than re-reading them
+        s1, s2, s3 = x[2], x[1], x[0]
+        for i in range(3, m):
+            s0 = c1 * x[i] + c2 * s1 + c3 * s2 + c4 * s3
+            result[i] = s0
+            s1, s2, s3 = s0, s1, s2
+    return result
+
+
+@njit(cache=True)
+def _ssf2_batch(x, c1, b1, a1):
+    """Two pole SSF over each row of a 2d float64 ndarray"""
+    result = npEmptyLike(x)
+    for j in range(x.shape[0]):
+        result[j] = _ssf2_loop(x[j], c1, b1, a1)
+    return result
+
+
+@njit(cache=True)
+def _ssf3_batch(x, c1, c2, c3, c4):
+    """Three pole SSF over each row of a 2d float64 ndarray"""
+    result = npEmptyLike(x)
+    for j in range(x.shape[0]):
+        result[j] = _ssf3_loop(x[j], c1, c2, c3, c4)
+    return result
+
+
+@lru_cache(maxsize=128)
+def _ssf_coefficients(length: int, poles: int) -> tuple:
+    """SSF filter coefficients: (c1, c2, c3, c4) for three poles, otherwise
+    (c1, b1, a1) for two poles."""
+    if poles == 3:
+        x = npPi / length # x = PI / n
+        a0 = npExp(-x) # e^(-x)
+        b0 = 2 * a0 * npCos(npSqrt(3) * x) # 2e^(-x)*cos(3^(.5) * x)
+        c0 = a0 * a0 # e^(-2x)
+
+        c4 = c0 * c0 # e^(-4x)
+        c3 = -c0 * (1 + b0) # -e^(-2x) * (1 + 2e^(-x)*cos(3^(.5) * x))
+        c2 = c0 + b0 # e^(-2x) + 2e^(-x)*cos(3^(.5) * x)
+        c1 = 1 - c2 - c3 - c4
+        return c1, c2, c3, c4
+
+    x = npPi * npSqrt(2) / length # x = PI * 2^(.5) / n
+    a0 = npExp(-x) # e^(-x)
+    a1 = -a0 * a0 # -e^(-2x)
+    b1 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
+    c1 = 1 - a1 - b1 # e^(-2x) - 2e^(-x)*cos(x) + 1
+    return c1, b1, a1
 
 
 def ssf(close, length=None, poles=None, offset=None, **kwargs):
@@ -17,32 +98,16 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
     if close is None: return
 
     # Calculate Result
-    m = close.size
-    ssf = close.copy()
+    np_close = close.to_numpy(dtype=float)
 
     if poles == 3:
-        x = npPi / length # x = PI / n
-        a0 = npExp(-x) # e^(-x)
-        b0 = 2 * a0 * npCos(npSqrt(3) * x) # 2e^(-x)*cos(3^(.5) * x)
-        c0 = a0 * a0 # e^(-2x)
-
-        c4 = c0 * c0 # e^(-4x)
-        c3 = -c0 * (1 + b0) # -e^(-2x) * (1 + 2e^(-x)*cos(3^(.5) * x))
-        c2 = c0 + b0 # e^(-2x) + 2e^(-x)*cos(3^(.5) * x)
-        c1 = 1 - c2 - c3 - c4
-
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + c2 * ssf.iloc[i - 1] + c3 * ssf.iloc[i - 2] + c4 * ssf.iloc[i - 3]
-
+        c1, c2, c3, c4 = _ssf_coefficients(length, poles)
+        ssf = _ssf3_loop(np_close, c1, c2, c3, c4)
     else: # poles == 2
-        x = npPi * npSqrt(2) / length # x = PI * 2^(.5) / n
-        a0 = npExp(-x) # e^(-x)
-        a1 = -a0 * a0 # -e^(-2x)
-        b1 = 2 * a0 * npCos(x) # 2e^(-x)*cos(x)
-        c1 = 1 - a1 - b1 # e^(-2x) - 2e^(-x)*cos(x) + 1
+        c1, b1, a1 = _ssf_coefficients(length, poles)
+        ssf = _ssf2_loop(np_close, c1, b1, a1)
 
-        for i in range(0, m):
-            ssf.iloc[i] = c1 * close.iloc[i] + b1 * ssf.iloc[i - 1] + a1 * ssf.iloc[i - 2]
+    ssf = Series(ssf, index=close.index)
 
     # Offset
     if offset != 0:
@@ -61,6 +126,46 @@ def ssf(close, length=None, poles=None, offset=None, **kwargs):
     return ssf
 
 
+def ssf_batch(closes, length=None, poles=None, offset=None, **kwargs):
+    """Indicator: Ehler's Super Smoother Filter (SSF) over multiple columns"""
+    # Validate Arguments
+    length = int(length) if length and length > 0 else 10
+    poles = int(poles) if poles in [2, 3] else 2
+    offset = get_offset(offset)
+
+    if not isinstance(closes, DataFrame) or closes.shape[0] < length: return
+
+    # Calculate Result
+    # One row per column so each recurrence runs over contiguous memory
+    np_closes = npAscontiguousarray(closes.to_numpy(dtype=float).T)
+
+    if poles == 3:
+        c1, c2, c3, c4 = _ssf_coefficients(length, poles)
+        result = _ssf3_batch(np_closes, c1, c2, c3, c4)
+    else: # poles == 2
+        c1, b1, a1 = _ssf_coefficients(length, poles)
+        result = _ssf2_batch(np_closes, c1, b1, a1)
+
+    _props = f"_{length}_{poles}"
+    ssfdf = DataFrame(result.T, index=closes.index, columns=[f"SSF{_props}_{c}" for c in closes.columns])
+
+    # Offset
+    if offset != 0:
+        ssfdf = ssfdf.shift(offset)
+
+    # Handle fills
+    if "fillna" in kwargs:
+        ssfdf.fillna(kwargs["fillna"], inplace=True)
+    if "fill_method" in kwargs:
+        ssfdf.fillna(method=kwargs["fill_method"], inplace=True)
+
+    # Name & Category
+    ssfdf.name = f"SSF{_props}"
+    ssfdf.category = "overlap"
+
+    return ssfdf
+
+
 ssf.__doc__ = \
 """Ehler's Super Smoother Filter (SSF) © 2013
 
@@ -97,3 +202,25 @@ Kwargs:
 Returns:
     pd.Series: New feature generated.
 """
+
+
+ssf_batch.__doc__ = \
+"""Ehler's Super Smoother Filter (SSF) over multiple columns
+
+Applies the same SSF as ssf() to every column of a DataFrame, for example
+the closes of several symbols. Each column is filtered independently in a
+single compiled loop when numba is installed.
+
+Args:
+    closes (pd.DataFrame): DataFrame of 'close' columns
+    length (int): It's period. Default: 10
+    poles (int): The number of poles to use, either 2 or 3. Default: 2
+    offset (int): How many periods to offset the result. Default: 0
+
+Kwargs:
+    fillna (value, optional): pd.DataFrame.fillna(value)
+    fill_method (value, optional): Type of fill method
+
+Returns:
+    pd.DataFrame: SSF_length_poles_column for each column.
+"""
@@ -1,6 +1,28 @@
 # -*- coding: utf-8 -*-
-from .hlc3 import hlc3
-from pandas_ta.utils import get_offset, is_datetime_ordered, verify_series
+from numpy import diff as npDiff
+from numpy import errstate as npErrstate
+from numpy import flatnonzero as npFlatnonzero
+from numpy import add as npAdd
+from numpy import isnan as npIsnan
+from numpy import nan as npNaN
+from numpy import nancumsum as npNancumsum
+from numpy import multiply as npMultiply
+from numpy import repeat as npRepeat
+from numpy import r_ as npR_
+from pandas import Series
+from pandas_ta.utils import get_offset, verify_series
+
+
+def _anchored_cumsum(x, anchors):
+    """Cumulative sum of x that restarts at every index in anchors. Like
+    Series.groupby(...).cumsum(), NaNs are skipped and remain NaN."""
+    cumsum = npNancumsum(x)
+    baseline = npR_[0.0, cumsum[anchors - 1]]
+    lengths = npDiff(npR_[0, anchors, x.size])
+    result = cumsum - npRepeat(baseline, lengths)
+    result[npIsnan(x)] = npNaN
+    return result
+
 
 def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
     """Indicator: Volume Weighted Average Price (VWAP)"""
@@ -12,16 +34,25 @@ def vwap(high, low, close, volume, anchor=None, offset=None, **kwargs):
     anchor = anchor.upper() if anchor and isinstance(anchor, str) and len(anchor) >= 1 else "D"
     offset = get_offset(offset)
 
-    typical_price = hlc3(high=high, low=low, close=close)
-    if not is_datetime_ordered(volume):
-        print(f"[!] VWAP volume series is not datetime ordered. Results may not be as expected.")
-    if not is_datetime_ordered(typical_price):
-        print(f"[!] VWAP price series is not datetime ordered. Results may not be as expected.")
+    # All series share the same index, so checking one of them is enough
+    if not high.index.is_monotonic_increasing:
+        print(f"[!] VWAP series are not datetime ordered. Results may not be as expected.")
 
     # Calculate Result
-    wp = typical_price * volume
-    vwap  = wp.groupby(wp.index.to_period(anchor)).cumsum()
-    vwap /= volume.groupby(volume.index.to_period(anchor)).cumsum()
+    # wp = hlc3 * volume, fused into a single buffer
+    np_volume = volume.to_numpy(dtype=float)
+    wp = npAdd(high.to_numpy(dtype=float), low.to_numpy(dtype=float))
+    npAdd(wp, close.to_numpy(dtype=float), out=wp)
+    npMultiply(wp, np_volume, out=wp)
+    wp /= 3.0
+
+    period = high.index.to_period(anchor).asi8
+    anchors = npFlatnonzero(npDiff(period)) + 1
+    vwap = _anchored_cumsum(wp, anchors)
+    # Zero volume bars at the start of an anchor are NaN, as with Series
+    with npErrstate(divide="ignore", invalid="ignore"):
+        vwap /= _anchored_cumsum(np_volume, anchors)
+    vwap = Series(vwap, index=high.index)
 
     # Offset
     if offset != 0:
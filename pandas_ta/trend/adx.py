@@ -29,8 +29,8 @@ def adx(high, low, close, length=None, lensig=None, scalar=None, mamode=None, dr
     pos = ((up > dn) & (up > 0)) * up
     neg = ((dn > up) & (dn > 0)) * dn
 
-    pos = pos.apply(zero)
-    neg = neg.apply(zero)
+    pos = zero(pos)
+    neg = zero(neg)
 
     k = scalar / atr_
     dmp = k * ma(mamode, pos, length=length)
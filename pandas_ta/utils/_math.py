@@ -1,47 +1,44 @@
 # -*- coding: utf-8 -*-
-from functools import reduce
-from math import floor as mfloor
+from functools import lru_cache, partial, reduce
 from operator import mul
 from sys import float_info as sflt
-from typing import List, Optional, Tuple
+from typing import Optional, Union
 
 from numpy import ones, triu
+from numpy import abs as npAbs
 from numpy import all as npAll
-from numpy import append as npAppend
+from numpy import arange as npArange
+from numpy import ascontiguousarray as npAscontiguousarray
 from numpy import array as npArray
-from numpy import corrcoef as npCorrcoef
+from numpy import concatenate as npConcatenate
 from numpy import dot as npDot
-from numpy import fabs as npFabs
+from numpy import empty as npEmpty
+from numpy import errstate as npErrstate
 from numpy import exp as npExp
+from numpy import int64 as npInt64
+from numpy import isnan as npIsnan
 from numpy import log as npLog
 from numpy import nan as npNaN
 from numpy import ndarray as npNdArray
-from numpy import seterr
 from numpy import sqrt as npSqrt
 from numpy import sum as npSum
+from numpy import where as npWhere
 
 from pandas import DataFrame, Series
 
 from pandas_ta import Imports
 from ._core import verify_series
+from ._njit import njit
 
 
-def combination(**kwargs: dict) -> int:
+def combination(n: int = 1, r: int = 0, *, repetition: bool = False, multichoose: bool = False) -> int:
     """https://stackoverflow.com/questions/4941753/is-there-a-math-ncr-function-in-python"""
-    n = int(npFabs(kwargs.pop("n", 1)))
-    r = int(npFabs(kwargs.pop("r", 0)))
+    n, r = abs(int(n)), abs(int(r))
 
-    if kwargs.pop("repetition", False) or kwargs.pop("multichoose", False):
+    if repetition or multichoose:
         n = n + r - 1
 
-    # if r < 0: return None
-    r = min(n, n - r)
-    if r == 0:
-        return 1
-
-    numerator = reduce(mul, range(n, n - r, -1), 1)
-    denominator = reduce(mul, range(1, r + 1), 1)
-    return numerator // denominator
+    return _combination(n, r)
 
 
 def erf(x):
@@ -67,23 +64,23 @@ def erf(x):
     return sign * y # erf(-x) = -erf(x)
 
 
-def fibonacci(n: int = 2, **kwargs: dict) -> npNdArray:
+def fibonacci(n: int = 2, *, zero: bool = False, weighted: bool = False) -> npNdArray:
     """Fibonacci Sequence as a numpy array"""
-    n = int(npFabs(n)) if n >= 0 else 2
+    n = int(n) if n >= 0 else 2
 
-    zero = kwargs.pop("zero", False)
     if zero:
         a, b = 0, 1
     else:
         n -= 1
         a, b = 1, 1
 
-    result = npArray([a])
-    for _ in range(0, n):
-        a, b = b, a + b
-        result = npAppend(result, a)
+    # fib(92) is the largest Fibonacci number that fits in an int64
+    m = max(n, 0) + 1
+    if m <= 92:
+        result = _fib_fill(npEmpty(m, dtype=npInt64), a, b)
+    else:
+        result = _fib_fill_py(npEmpty(m, dtype=object), a, b)
 
-    weighted = kwargs.pop("weighted", False)
     if weighted:
         fib_sum = npSum(result)
         if fib_sum > 0:
@@ -109,8 +106,13 @@ def geometric_mean(series: Series) -> float:
     return 0
 
 
-def linear_regression(x: Series, y: Series) -> dict:
-    """Classic Linear Regression in Numpy or Scikit-Learn"""
+def linear_regression(x: Series, y: Series, **kwargs: dict) -> dict:
+    """Classic Linear Regression in Numpy or Scikit-Learn
+
+    The closed form Numpy solution is used by default. Pass sklearn=True to
+    fit with Scikit-Learn instead, if it is installed. Note: the Scikit-Learn
+    'r' is the coefficient of determination (R^2), not the correlation.
+    """
     x, y = verify_series(x), verify_series(y)
     m, n = x.size, y.size
 
@@ -118,7 +120,7 @@ def linear_regression(x: Series, y: Series) -> dict:
         print(f"[X] Linear Regression X and y have unequal total observations: {m} != {n}")
         return {}
 
-    if Imports["sklearn"]:
+    if kwargs.pop("sklearn", False) and Imports["sklearn"]:
         return _linear_regression_sklearn(x, y)
     else:
         return _linear_regression_np(x, y)
@@ -135,74 +137,47 @@ def log_geometric_mean(series: Series) -> float:
         return 0
 
 
-def pascals_triangle(n: int = None, **kwargs: dict) -> npNdArray:
+def pascals_triangle(n: int = None, *, weighted: bool = False, inverse: bool = False) -> npNdArray:
     """Pascal's Triangle
 
     Returns a numpy array of the nth row of Pascal's Triangle.
     n=4  => triangle: [1, 4, 6, 4, 1]
          => weighted: [0.0625, 0.25, 0.375, 0.25, 0.0625]
          => inverse weighted: [0.9375, 0.75, 0.625, 0.75, 0.9375]
-    """
-    n = int(npFabs(n)) if n is not None else 0
-
-    # Calculation
-    triangle = npArray([combination(n=n, r=i) for i in range(0, n + 1)])
-    triangle_sum = npSum(triangle)
-    triangle_weights = triangle / triangle_sum
-    inverse_weights = 1 - triangle_weights
-
-    weighted = kwargs.pop("weighted", False)
-    inverse = kwargs.pop("inverse", False)
-    if weighted and inverse:
-        return inverse_weights
-    if weighted:
-        return triangle_weights
-    if inverse:
-        return None
 
-    return triangle
+    Note: Results are cached, so the returned array is read-only.
+    """
+    n = abs(int(n)) if n is not None else 0
+    return _pascals_triangle(n, bool(weighted), bool(inverse))
 
 
-def symmetric_triangle(n: int = None, **kwargs: dict) -> Optional[List[int]]:
+def symmetric_triangle(n: int = None, *, weighted: bool = False) -> Optional[npNdArray]:
     """Symmetric Triangle with n >= 2
 
     Returns a numpy array of the nth row of Symmetric Triangle.
     n=4  => triangle: [1, 2, 2, 1]
          => weighted: [0.16666667 0.33333333 0.33333333 0.16666667]
-    """
-    n = int(npFabs(n)) if n is not None else 2
-
-    triangle = None
-    if n == 2:
-        triangle = [1, 1]
-
-    if n > 2:
-        if n % 2 == 0:
-            front = [i + 1 for i in range(0, mfloor(n / 2))]
-            triangle = front + front[::-1]
-        else:
-            front = [i + 1 for i in range(0, mfloor(0.5 * (n + 1)))]
-            triangle = front.copy()
-            front.pop()
-            triangle += front[::-1]
-
-    if kwargs.pop("weighted", False) and isinstance(triangle, list):
-        triangle_sum = npSum(triangle)
-        triangle_weights = triangle / triangle_sum
-        return triangle_weights
 
-    return triangle
+    Note: Results are cached, so the returned array is read-only.
+    """
+    n = abs(int(n)) if n is not None else 2
+    return _symmetric_triangle(n, bool(weighted))
 
 
-def weights(w: npNdArray):
-    """Calculates the dot product of weights with values x"""
-    def _dot(x):
-        return npDot(w, x)
-    return _dot
+def weights(w: npNdArray) -> partial:
+    """Calculates the dot product of weights with values x. The weights are
+    converted once to a contiguous float array. Pair with raw=True, i.e.
+    Series.rolling(n).apply(weights(w), raw=True), to pass ndarrays."""
+    return partial(npDot, npAscontiguousarray(w, dtype=float))
 
 
-def zero(x: Tuple[int, float]) -> Tuple[int, float]:
-    """If the value is close to zero, then return zero. Otherwise return itself."""
+def zero(x: Union[int, float, npNdArray, Series]) -> Union[int, float, npNdArray, Series]:
+    """If the value is close to zero, then return zero. Otherwise return itself.
+    Series and numpy arrays are zeroed elementwise in one vectorized pass."""
+    if isinstance(x, Series):
+        return x.mask(x.abs() < sflt.epsilon, 0)
+    if isinstance(x, npNdArray):
+        return npWhere(npAbs(x) < sflt.epsilon, 0, x)
     return 0 if abs(x) < sflt.epsilon else x
 
 
@@ -230,46 +205,123 @@ def df_error_analysis(dfA: DataFrame, dfB: DataFrame, **kwargs: dict) -> DataFra
 
 
 # PRIVATE
+@lru_cache(maxsize=4096)
+def _combination(n: int, r: int) -> int:
+    """Memoized n choose r for non-negative ints. See combination()."""
+    # if r < 0: return None
+    r = min(n, n - r)
+    if r == 0:
+        return 1
+
+    numerator = reduce(mul, range(n, n - r, -1), 1)
+    denominator = reduce(mul, range(1, r + 1), 1)
+    return numerator // denominator
+
+
+def _fib_fill_py(result: npNdArray, a: int, b: int) -> npNdArray:
+    """Fills result with the Fibonacci recurrence starting from a, b."""
+    result[0] = a
+    for i in range(1, result.size):
+        a, b = b, a + b
+        result[i] = a
+    return result
+
+# Compiled for int64 buffers, Python ints beyond fib(92) use _fib_fill_py
+_fib_fill = njit(cache=True)(_fib_fill_py)
+
+
+@lru_cache(maxsize=256)
+def _pascals_triangle(n: int, weighted: bool, inverse: bool) -> Optional[npNdArray]:
+    """Memoized row of Pascal's Triangle. See pascals_triangle()."""
+    if inverse and not weighted:
+        return None
+
+    # Calculation: C(n, k + 1) = C(n, k) * (n - k) / (k + 1)
+    row = [1]
+    for k in range(0, n):
+        row.append(row[k] * (n - k) // (k + 1))
+    triangle = npArray(row)
+
+    if weighted:
+        triangle = triangle / npSum(triangle)
+        if inverse:
+            triangle = 1 - triangle
+
+    triangle.flags.writeable = False
+    return triangle
+
+
+@lru_cache(maxsize=256)
+def _symmetric_triangle(n: int, weighted: bool) -> Optional[npNdArray]:
+    """Memoized row of the Symmetric Triangle. See symmetric_triangle()."""
+    if n < 2:
+        return None
+
+    front = npArange(1, (n + 1) // 2 + 1)
+    if n % 2 == 0:
+        triangle = npConcatenate((front, front[::-1]))
+    else:
+        triangle = npConcatenate((front, front[-2::-1]))
+
+    if weighted:
+        triangle = triangle / npSum(triangle)
+
+    triangle.flags.writeable = False
+    return triangle
+
+
 def _linear_regression_np(x: Series, y: Series) -> dict:
-    """Simple Linear Regression in Numpy for two 1d arrays for environments without the sklearn package."""
+    """Simple Linear Regression in Numpy for two 1d arrays. The default solver
+    for linear_regression()."""
     result = {"a": npNaN, "b": npNaN, "r": npNaN, "t": npNaN, "line": npNaN}
-    x_sum = x.sum()
-    y_sum = y.sum()
+    # Convert once, everything below is plain ndarray math
+    np_x, np_y = x.to_numpy(dtype=float), y.to_numpy(dtype=float)
+
+    # Like the NaN skipping Series sums, only fit the pairs without NaNs
+    valid = ~(npIsnan(np_x) | npIsnan(np_y))
+    valid_x, valid_y = np_x[valid], np_y[valid]
+    x_sum = valid_x.sum()
 
     if int(x_sum) != 0:
-        # 1st row, 2nd col value corr(x, y)
-        r = npCorrcoef(x, y)[0, 1]
-
-        m = x.size
-        r_mix = m * (x * y).sum() - x_sum * y_sum
-        b = r_mix // (m * (x * x).sum() - x_sum * x_sum)
-        a = y.mean() - b * x.mean()
-        line = a + b * x
-
-        _np_err = seterr()
-        seterr(divide="ignore", invalid="ignore")
-        result = {
-            "a": a, "b": b, "r": r,
-            "t": r / npSqrt((1 - r * r) / (m - 2)),
-            "line": line,
-        }
-        seterr(divide=_np_err["divide"], invalid=_np_err["invalid"])
+        m = valid_x.size
+        x_mean, y_mean = x_sum / m, valid_y.mean()
+
+        # Centered sums of squares and cross products with single dot products
+        xc, yc = valid_x - x_mean, valid_y - y_mean
+        sxx, syy, sxy = npDot(xc, xc), npDot(yc, yc), npDot(xc, yc)
+
+        # r = corr(x, y)
+        r = sxy / npSqrt(sxx * syy)
+        b = sxy / sxx
+        a = y_mean - b * x_mean
+        line = Series(a + b * np_x, index=x.index, name=x.name)
+
+        with npErrstate(divide="ignore", invalid="ignore"):
+            t = r / npSqrt((1 - r * r) / (m - 2))
+
+        result = {"a": a, "b": b, "r": r, "t": t, "line": line}
 
     return result
 
+
 def _linear_regression_sklearn(x: Series, y: Series) -> dict:
     """Simple Linear Regression in Scikit Learn for two 1d arrays for
     environments with the sklearn package."""
     from sklearn.linear_model import LinearRegression
 
-    X = DataFrame(x)
-    lr = LinearRegression().fit(X, y=y)
-    r = lr.score(X, y=y)
+    np_x, np_y = x.to_numpy(dtype=float), y.to_numpy(dtype=float)
+    lr = LinearRegression().fit(np_x.reshape(-1, 1), np_y)
     a, b = lr.intercept_, lr.coef_[0]
+    line = a + b * np_x
+
+    # Same as lr.score(X, y) without a second predict pass
+    residuals = np_y - line
+    deviations = np_y - np_y.mean()
+    r = 1 - npDot(residuals, residuals) / npDot(deviations, deviations)
 
     result = {
         "a": a, "b": b, "r": r,
         "t": r / npSqrt((1 - r * r) / (x.size - 2)),
-        "line": a + b * x
+        "line": Series(line, index=x.index, name=x.name)
     }
     return result
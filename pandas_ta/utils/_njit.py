@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+from pandas_ta import Imports
+
+
+if Imports["numba"]:
+    from numba import njit
+else:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed. Supports
+        both the bare @njit and the @njit(...) decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def _decorator(fn):
+            return fn
+        return _decorator
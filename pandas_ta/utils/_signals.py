@@ -2,7 +2,6 @@
 from pandas import DataFrame, Series
 
 from ._core import get_offset, verify_series
-from ._math import zero
 
 
 def _above_below(series_a: Series, series_b: Series, above: bool = True, asint: bool = True, offset: int = None, **kwargs):
@@ -10,9 +9,6 @@ def _above_below(series_a: Series, series_b: Series, above: bool = True, asint:
     series_b = verify_series(series_b)
     offset = get_offset(offset)
 
-    series_a.apply(zero)
-    series_b.apply(zero)
-
     # Calculate Result
     if above:
         current = series_a >= series_b
@@ -69,9 +65,6 @@ def cross(series_a: Series, series_b: Series, above: bool = True, asint: bool =
     series_b = verify_series(series_b)
     offset = get_offset(offset)
 
-    series_a.apply(zero)
-    series_b.apply(zero)
-
     # Calculate Result
     current = series_a > series_b  # current is above
     previous = series_a.shift(1) < series_b.shift(1)  # previous is below
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-from datetime import datetime
 from time import localtime, perf_counter
 from typing import Tuple
 
@@ -18,25 +17,25 @@ def df_dates(df: DataFrame, dates: Tuple[str, list] = None) -> DataFrame:
 
 def df_month_to_date(df: DataFrame) -> DataFrame:
     """Yields the Month-to-Date (MTD) DataFrame"""
-    in_mtd = df.index >= Timestamp.now().strftime("%Y-%m-01")
-    if any(in_mtd): return df[in_mtd]
+    now = Timestamp.now()
+    in_mtd = df.index >= _first_day(df, now.year, now.month)
+    if in_mtd.any(): return df.loc[in_mtd]
     return df
 
 
 def df_quarter_to_date(df: DataFrame) -> DataFrame:
     """Yields the Quarter-to-Date (QTD) DataFrame"""
     now = Timestamp.now()
-    for m in [1, 4, 7, 10]:
-        if now.month <= m:
-                in_qtr = df.index >= datetime(now.year, m, 1).strftime("%Y-%m-01")
-                if any(in_qtr): return df[in_qtr]
-    return df[df.index >= now.strftime("%Y-%m-01")]
+    qtr_month = 3 * ((now.month - 1) // 3) + 1 # 1, 4, 7 or 10
+    in_qtd = df.index >= _first_day(df, now.year, qtr_month)
+    if in_qtd.any(): return df.loc[in_qtd]
+    return df
 
 
 def df_year_to_date(df: DataFrame) -> DataFrame:
     """Yields the Year-to-Date (YTD) DataFrame"""
-    in_ytd = df.index >= Timestamp.now().strftime("%Y-01-01")
-    if any(in_ytd): return df[in_ytd]
+    in_ytd = df.index >= _first_day(df, Timestamp.now().year, 1)
+    if in_ytd.any(): return df.loc[in_ytd]
     return df
 
 
@@ -81,19 +80,17 @@ def total_time(df: DataFrame, tf: str = "years") -> float:
     and 'seconds'. Default: 'years'.
     Useful for annualization."""
     time_diff = df.index[-1] - df.index[0]
-    TimeFrame = {
-        "years": time_diff.days / RATE["TRADING_DAYS_PER_YEAR"],
-        "months": time_diff.days / 30.417,
-        "weeks": time_diff.days / 7,
-        "days": time_diff.days,
-        "hours": time_diff.days * 24,
-        "minutes": time_diff.total_seconds() / 60,
-        "seconds": time_diff.total_seconds()
-    }
 
-    if isinstance(tf, str) and tf in TimeFrame.keys():
-        return TimeFrame[tf]
-    return TimeFrame["years"]
+    # Only compute the requested timeframe
+    if tf == "minutes": return time_diff.total_seconds() / 60
+    if tf == "seconds": return time_diff.total_seconds()
+
+    days = time_diff.days
+    if tf == "months": return days / 30.417
+    if tf == "weeks": return days / 7
+    if tf == "days": return days
+    if tf == "hours": return days * 24
+    return days / RATE["TRADING_DAYS_PER_YEAR"]
 
 
 def to_utc(df: DataFrame) -> DataFrame:
@@ -108,6 +105,13 @@ def to_utc(df: DataFrame) -> DataFrame:
     return df
 
 
+# Private
+def _first_day(df: DataFrame, year: int, month: int) -> Timestamp:
+    """The first day of the month as a Timestamp in the timezone of the
+    DataFrame Index, so it compares directly without parsing a date string."""
+    return Timestamp(year=year, month=month, day=1, tz=getattr(df.index, "tz", None))
+
+
 # Aliases
 mtd = df_month_to_date
 qtd = df_quarter_to_date
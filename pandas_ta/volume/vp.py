@@ -1,8 +1,21 @@
 # -*- coding: utf-8 -*-
-from numpy import array_split
-from numpy import mean
-from pandas import cut, concat, DataFrame
-from pandas_ta.utils import signed_series, verify_series
+from numpy import add as npAdd
+from numpy import bincount as npBincount
+from numpy import clip as npClip
+from numpy import cumsum as npCumsum
+from numpy import diff as npDiff
+from numpy import digitize as npDigitize
+from numpy import errstate as npErrstate
+from numpy import fmax as npFmax
+from numpy import fmin as npFmin
+from numpy import full as npFull
+from numpy import isnan as npIsnan
+from numpy import linspace as npLinspace
+from numpy import nan as npNaN
+from numpy import nan_to_num as npNanToNum
+from numpy import where as npWhere
+from pandas import DataFrame
+from pandas_ta.utils import verify_series
 
 
 def vp(close, volume, width=None, **kwargs):
@@ -16,49 +29,69 @@ def vp(close, volume, width=None, **kwargs):
     if close is None or volume is None: return
 
     # Setup
-    signed_price = signed_series(close, 1)
-    pos_volume = volume * signed_price[signed_price > 0]
-    pos_volume.name = volume.name
-    neg_volume = -volume * signed_price[signed_price < 0]
-    neg_volume.name = volume.name
-    vp = concat([close, pos_volume, neg_volume], axis=1)
-
-    close_col = f"{vp.columns[0]}"
+    # Unnamed series are labeled by position, as pd.concat would label them
+    close_col = f"{close.name if close.name is not None else 0}"
     high_price_col = f"high_{close_col}"
     low_price_col = f"low_{close_col}"
     mean_price_col = f"mean_{close_col}"
 
-    volume_col = f"{vp.columns[1]}"
+    volume_col = f"{volume.name if volume.name is not None else 1}"
     pos_volume_col = f"pos_{volume_col}"
     neg_volume_col = f"neg_{volume_col}"
     total_volume_col = f"total_{volume_col}"
-    vp.columns = [close_col, pos_volume_col, neg_volume_col]
+
+    np_close = close.to_numpy(dtype=float)
+    np_volume = npNanToNum(volume.to_numpy(dtype=float))
+
+    # Same signs as signed_series(close, 1), the first bar counts as positive
+    price_change = npDiff(np_close, prepend=npNaN)
+    price_change[0] = 1
+    pos_volume = npWhere(price_change > 0, np_volume, 0.0)
+    neg_volume = npWhere(price_change < 0, np_volume, 0.0)
 
     # sort_close: Sort by close before splitting into ranges. Default: False
     # If False, it sorts by date index or chronological versus by price
 
     if sort_close:
-        vp[mean_price_col] = vp[close_col]
-        vpdf = vp.groupby(cut(vp[close_col], width, include_lowest=True, precision=2)).agg({
-            mean_price_col: mean,
-            pos_volume_col: sum,
-            neg_volume_col: sum,
-        })
-        vpdf[low_price_col] = [x.left for x in vpdf.index]
-        vpdf[high_price_col] = [x.right for x in vpdf.index]
-        vpdf = vpdf.reset_index(drop=True)
-        vpdf = vpdf[[low_price_col, mean_price_col, high_price_col, pos_volume_col, neg_volume_col]]
+        # Equal width price ranges (low, high], the first includes its low
+        valid = ~npIsnan(np_close)
+        np_close = np_close[valid]
+        edges = npLinspace(np_close.min(), np_close.max(), width + 1)
+        vp_ranges = npClip(npDigitize(np_close, edges, right=True) - 1, 0, width - 1)
+
+        low_close, high_close = edges[:-1], edges[1:]
+        close_sum = npBincount(vp_ranges, weights=np_close, minlength=width)
+        close_count = npBincount(vp_ranges, minlength=width)
+        pos_sum = npBincount(vp_ranges, weights=pos_volume[valid], minlength=width)
+        neg_sum = npBincount(vp_ranges, weights=neg_volume[valid], minlength=width)
     else:
-        vp_ranges = array_split(vp, width)
-        result = ({
-            low_price_col: r[close_col].min(),
-            mean_price_col: r[close_col].mean(),
-            high_price_col: r[close_col].max(),
-            pos_volume_col: r[pos_volume_col].sum(),
-            neg_volume_col: r[neg_volume_col].sum(),
-        } for r in vp_ranges)
-        vpdf = DataFrame(result)
-    vpdf[total_volume_col] = vpdf[pos_volume_col] + vpdf[neg_volume_col]
+        # Consecutive ranges with the same sizes as np.array_split(vp, width)
+        m = np_close.size
+        range_sizes = npFull(width, m // width)
+        range_sizes[:m % width] += 1
+        range_starts = npCumsum(range_sizes) - range_sizes
+
+        # Like DataFrame.groupby(...).agg(), NaN closes are skipped
+        valid = ~npIsnan(np_close)
+        low_close = npFmin.reduceat(np_close, range_starts)
+        high_close = npFmax.reduceat(np_close, range_starts)
+        close_sum = npAdd.reduceat(npWhere(valid, np_close, 0.0), range_starts)
+        close_count = npAdd.reduceat(valid.astype(int), range_starts)
+        pos_sum = npAdd.reduceat(pos_volume, range_starts)
+        neg_sum = npAdd.reduceat(neg_volume, range_starts)
+
+    # Empty ranges have a NaN mean
+    with npErrstate(invalid="ignore"):
+        mean_close = close_sum / close_count
+
+    vpdf = DataFrame({
+        low_price_col: low_close,
+        mean_price_col: mean_close,
+        high_price_col: high_close,
+        pos_volume_col: pos_sum,
+        neg_volume_col: neg_sum,
+        total_volume_col: pos_sum + neg_sum,
+    })
 
     # Handle fills
     if "fillna" in kwargs:
@@ -89,9 +122,13 @@ Calculation:
     Default Inputs:
         width=10
 
-    vp = pd.concat([close, pos_volume, neg_volume], axis=1)
+    signed_price = signed_series(close, 1)
+    pos_volume = np.where(signed_price > 0, volume, 0)
+    neg_volume = np.where(signed_price < 0, volume, 0)
+    vp = pd.DataFrame([close, pos_volume, neg_volume])
     if sort_close:
-        vp_ranges = cut(vp[close_col], width)
+        edges = np.linspace(close.min(), close.max(), width + 1)
+        vp_ranges = np.digitize(close, edges, right=True) - 1
         result = ({range_left, mean_close, range_right, pos_volume, neg_volume} foreach range in vp_ranges
     else:
         vp_ranges = np.array_split(vp, width)
@@ -1,7 +1,10 @@
 from .config import sample_data
 from .context import pandas_ta
 
+from contextlib import redirect_stdout
+from io import StringIO
 from unittest import skip, TestCase
+from unittest.mock import patch
 from pandas import DataFrame
 
 
@@ -18,6 +21,34 @@ class TestOverlapExtension(TestCase):
     def tearDown(self): pass
 
 
+    def test_call_ext(self):
+        result = self.data.ta(kind="HL2")
+        self.assertEqual(result.name, "HL2")
+        self.assertTrue(result.equals(self.data.ta.hl2()))
+
+    def test_call_error_ext(self):
+        # Errors raised by the indicator reach the caller
+        with patch.object(pandas_ta.AnalysisIndicators, "hl2", side_effect=ValueError("hl2")):
+            with self.assertRaises(ValueError):
+                self.data.ta(kind="hl2")
+
+    def test_call_not_indicator_ext(self):
+        for kind in ["nope", "_get_column"]:
+            with redirect_stdout(StringIO()) as out:
+                result = self.data.ta(kind=kind)
+            self.assertIsNone(result)
+            self.assertEqual(out.getvalue(), f"[X] '{kind}' is not an indicator. See: df.ta.indicators()\n")
+
+    def test_call_without_kind_ext(self):
+        with redirect_stdout(StringIO()) as out:
+            result = self.data.ta()
+        self.assertIsNone(result)
+
+        with redirect_stdout(StringIO()) as expected:
+            self.data.ta.indicators()
+        self.assertEqual(out.getvalue(), expected.getvalue())
+        self.assertIn("hl2", out.getvalue())
+
     def test_alma_ext(self):
         self.data.ta.alma(append=True)
         self.assertIsInstance(self.data, DataFrame)
@@ -132,6 +163,18 @@ class TestOverlapExtension(TestCase):
         self.assertIsInstance(self.data, DataFrame)
         self.assertEqual(self.data.columns[-1], "SSF_10_3")
 
+    def test_ssf_batch_ext(self):
+        self.data.ta.ssf_batch(columns=["open", "close"], append=True, poles=2)
+        self.assertIsInstance(self.data, DataFrame)
+        self.assertEqual(list(self.data.columns[-2:]), ["SSF_10_2_open", "SSF_10_2_close"])
+
+        # Missing columns are skipped, and nothing is appended if all are missing
+        result = self.data.ta.ssf_batch(columns=["close", "nope"], poles=3)
+        self.assertEqual(list(result.columns), ["SSF_10_3_close"])
+        ncols = self.data.shape[1]
+        self.data.ta.ssf_batch(columns=["nope"], append=True)
+        self.assertEqual(self.data.shape[1], ncols)
+
     def test_swma_ext(self):
         self.data.ta.swma(append=True)
         self.assertIsInstance(self.data, DataFrame)
@@ -2,6 +2,8 @@ from .config import sample_data
 from .context import pandas_ta
 
 from unittest import TestCase
+import numpy as np
+import numpy.testing as npt
 from pandas import DataFrame
 
 
@@ -104,3 +106,18 @@ class TestVolumeExtension(TestCase):
         result = self.data.ta.vp()
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "VP_10")
+
+        # Chronological ranges are the np.array_split chunks of the bars
+        close = self.data["close"]
+        chunks = np.array_split(close, 10)
+        npt.assert_allclose(result["low_close"], [c.min() for c in chunks])
+        npt.assert_allclose(result["mean_close"], [c.mean() for c in chunks])
+        npt.assert_allclose(result["high_close"], [c.max() for c in chunks])
+        npt.assert_allclose(result["total_volume"], result["pos_volume"] + result["neg_volume"])
+
+        # Sorted by price, the range edges split the close range evenly
+        result = self.data.ta.vp(sort_close=True)
+        edges = np.linspace(close.min(), close.max(), 11)
+        npt.assert_allclose(result["low_close"], edges[:-1])
+        npt.assert_allclose(result["high_close"], edges[1:])
+        npt.assert_allclose(result["total_volume"].sum(), self.data.ta.vp()["total_volume"].sum())
@@ -2,8 +2,9 @@ from .config import CORRELATION, CORRELATION_THRESHOLD, error_analysis, sample_d
 from .context import pandas_ta
 
 from unittest import TestCase
+import numpy as np
 import pandas.testing as pdt
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, date_range
 
 import talib as tal
 
@@ -332,10 +333,36 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "SSF_10_2")
 
+        # The first two bars seed the filter, then the recurrence begins
+        close = self.close.to_numpy()
+        pdt.assert_series_equal(result.iloc[:2], self.close.iloc[:2], check_names=False)
+        x = np.pi * np.sqrt(2) / 10
+        a1, b1 = -np.exp(-2 * x), 2 * np.exp(-x) * np.cos(x)
+        c1 = 1 - a1 - b1
+        self.assertAlmostEqual(result.iloc[2], c1 * close[2] + b1 * close[1] + a1 * close[0])
+
         result = pandas_ta.ssf(self.close, poles=3)
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "SSF_10_3")
 
+        pdt.assert_series_equal(result.iloc[:3], self.close.iloc[:3], check_names=False)
+        x = np.pi / 10
+        b0, c0 = 2 * np.exp(-x) * np.cos(np.sqrt(3) * x), np.exp(-2 * x)
+        c2, c3, c4 = c0 + b0, -c0 * (1 + b0), c0 * c0
+        c1 = 1 - c2 - c3 - c4
+        self.assertAlmostEqual(result.iloc[3], c1 * close[3] + c2 * close[2] + c3 * close[1] + c4 * close[0])
+
+    def test_ssf_batch(self):
+        result = pandas_ta.ssf_batch(self.data[["open", "close"]], poles=2)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "SSF_10_2")
+        pdt.assert_series_equal(result["SSF_10_2_close"], pandas_ta.ssf(self.close, poles=2), check_names=False)
+
+        result = pandas_ta.ssf_batch(self.data[["open", "close"]], poles=3)
+        self.assertIsInstance(result, DataFrame)
+        self.assertEqual(result.name, "SSF_10_3")
+        pdt.assert_series_equal(result["SSF_10_3_open"], pandas_ta.ssf(self.open, poles=3), check_names=False)
+
     def test_swma(self):
         result = pandas_ta.swma(self.close)
         self.assertIsInstance(result, Series)
@@ -413,6 +440,25 @@ class TestOverlap(TestCase):
         self.assertIsInstance(result, Series)
         self.assertEqual(result.name, "VWAP_D")
 
+        # Intraday bars with NaN bars and zero volume anchor opens must match
+        # the grouped cumulative sums for every anchor
+        index = date_range("2021-01-01", periods=400, freq="6H")
+        rng = np.random.default_rng(0)
+        close = Series(100 + rng.standard_normal(index.size).cumsum(), index=index)
+        high, low = close + 1, close - 1
+        volume = Series(rng.integers(1, 1000, index.size), index=index, dtype=float)
+        volume[index.hour == 0] = 0
+        high.iloc[[5, 50]] = np.nan
+        volume.iloc[[7, 90]] = np.nan
+
+        wp = volume * (high + low + close) / 3
+        for anchor in ["D", "W", "M"]:
+            period = index.to_period(anchor)
+            expected = wp.groupby(period).cumsum() / volume.groupby(period).cumsum()
+            result = pandas_ta.vwap(high, low, close, volume, anchor=anchor)
+            self.assertEqual(result.name, f"VWAP_{anchor}")
+            pdt.assert_series_equal(result, expected, check_names=False)
+
     def test_vwma(self):
         result = pandas_ta.vwma(self.close, self.volume)
         self.assertIsInstance(result, Series)
@@ -2,8 +2,10 @@ from .config import error_analysis, sample_data, CORRELATION, CORRELATION_THRESH
 from .context import pandas_ta
 
 from unittest import TestCase, skip
+import numpy as np
+import numpy.testing as npt
 import pandas.testing as pdt
-from pandas import DataFrame, Series
+from pandas import cut, DataFrame, Series
 
 import talib as tal
 
@@ -174,3 +176,32 @@ class TestVolume(TestCase):
         result = pandas_ta.vp(self.close, self.volume_)
         self.assertIsInstance(result, DataFrame)
         self.assertEqual(result.name, "VP_10")
+
+        # Sorted by price, the ranges are the equal width bins of pd.cut
+        result = pandas_ta.vp(self.close, self.volume_, sort_close=True)
+        edges = np.linspace(self.close.min(), self.close.max(), 11)
+        npt.assert_allclose(result["low_close"], edges[:-1])
+        npt.assert_allclose(result["high_close"], edges[1:])
+
+        sign = pandas_ta.utils.signed_series(self.close, 1)
+        vp = DataFrame({
+            "close": self.close,
+            "pos": self.volume_.where(sign > 0, 0),
+            "neg": self.volume_.where(sign < 0, 0),
+        }).groupby(cut(self.close, edges, include_lowest=True))
+        npt.assert_allclose(result["mean_close"], vp["close"].mean())
+        npt.assert_allclose(result["pos_volume"], vp["pos"].sum())
+        npt.assert_allclose(result["neg_volume"], vp["neg"].sum())
+        npt.assert_allclose(result["total_volume"], vp["pos"].sum() + vp["neg"].sum())
+
+        # Chronological ranges skip NaN closes, unnamed series are labeled by position
+        close = Series([1, 3, np.nan, 2, 5, 4, 6])
+        volume = Series([10, 20, 30, 40, 50, 60, 70])
+        result = pandas_ta.vp(close, volume, width=3)
+        self.assertEqual(list(result.columns), ["low_0", "mean_0", "high_0", "pos_1", "neg_1", "total_1"])
+        npt.assert_allclose(result["low_0"], [1, 2, 4])
+        npt.assert_allclose(result["mean_0"], [2, 3.5, 5])
+        npt.assert_allclose(result["high_0"], [3, 5, 6])
+        npt.assert_allclose(result["pos_1"], [30, 50, 70])
+        npt.assert_allclose(result["neg_1"], [0, 0, 60])
+        npt.assert_allclose(result["total_1"], [30, 50, 130])
@@ -109,6 +109,13 @@ class TestStrategyMethods(TestCase):
         self.category = "Common"
         self.data.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
 
+    def test_ssf_batch_then_multiprocessing(self):
+        # Compiled ssf_batch must not leave threads behind that deadlock
+        # the forked Pool workers of a following strategy
+        self.category = "SSF Batch then Common"
+        self.data.ta.ssf_batch(columns=["open", "close"], append=True)
+        self.data.ta.strategy(pandas_ta.CommonStrategy, verbose=verbose, timed=strategy_timed)
+
     def test_cycles_category(self):
         self.category = "Cycles"
         self.data.ta.strategy(self.category, verbose=verbose, timed=strategy_timed)
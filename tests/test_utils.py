@@ -6,7 +6,8 @@ from unittest.mock import patch
 
 import numpy as np
 import numpy.testing as npt
-from pandas import DataFrame, Series
+import pandas.testing as pdt
+from pandas import date_range, DataFrame, Series, Timestamp
 from pandas.api.types import is_datetime64_ns_dtype, is_datetime64tz_dtype
 
 
@@ -31,10 +32,14 @@ class TestUtilities(TestCase):
 
     def setUp(self):
         self.crosseddf = DataFrame(data)
+        # Daily bars over the last two years up to today
+        index = date_range(end=Timestamp.now().normalize(), periods=800, freq="D")
+        self.recentdf = DataFrame({"close": range(index.size)}, index=index)
         self.utils = pandas_ta.utils
 
     def tearDown(self):
         del self.crosseddf
+        del self.recentdf
         del self.utils
 
     def test__add_prefix_suffix(self):
@@ -149,17 +154,32 @@ class TestUtilities(TestCase):
         result = self.utils.df_dates(self.data, ["1999-11-01", "2020-08-15", "2020-08-24", "2020-08-25", "2020-08-26", "2020-08-27"])
         self.assertEqual(5, result.shape[0])
 
-    @skip
     def test_df_month_to_date(self):
-        result = self.utils.df_month_to_date(self.data)
+        df = self.recentdf
+        expected = df.loc[df.index.to_period("M") == Timestamp.now().to_period("M")]
+        pdt.assert_frame_equal(self.utils.df_month_to_date(df), expected)
+        pdt.assert_frame_equal(self.utils.mtd(df.tz_localize("UTC")), expected.tz_localize("UTC"))
+
+        # Data ending before the current month is returned whole
+        pdt.assert_frame_equal(self.utils.df_month_to_date(self.data), self.data)
 
-    @skip
     def test_df_quarter_to_date(self):
-        result = self.utils.df_quarter_to_date(self.data)
+        df = self.recentdf
+        expected = df.loc[df.index.to_period("Q") == Timestamp.now().to_period("Q")]
+        pdt.assert_frame_equal(self.utils.df_quarter_to_date(df), expected)
+        pdt.assert_frame_equal(self.utils.qtd(df.tz_localize("UTC")), expected.tz_localize("UTC"))
+
+        # Data ending before the current quarter is returned whole
+        pdt.assert_frame_equal(self.utils.df_quarter_to_date(self.data), self.data)
 
-    @skip
     def test_df_year_to_date(self):
-        result = self.utils.df_year_to_date(self.data)
+        df = self.recentdf
+        expected = df.loc[df.index.to_period("Y") == Timestamp.now().to_period("Y")]
+        pdt.assert_frame_equal(self.utils.df_year_to_date(df), expected)
+        pdt.assert_frame_equal(self.utils.ytd(df.tz_localize("UTC")), expected.tz_localize("UTC"))
+
+        # Data ending before the current year is returned whole
+        pdt.assert_frame_equal(self.utils.df_year_to_date(self.data), self.data)
 
     def test_fibonacci(self):
         self.assertIs(type(self.utils.fibonacci(zero=True, weighted=False)), np.ndarray)
@@ -224,6 +244,19 @@ class TestUtilities(TestCase):
         self.assertIsInstance(result["r"], float)
         self.assertIsInstance(result["t"], float)
         self.assertIsInstance(result["line"], Series)
+        self.assertAlmostEqual(result["a"], 1.11)
+        self.assertAlmostEqual(result["b"], 0.55)
+        npt.assert_allclose(result["line"], 1.11 + 0.55 * x)
+
+        # Pairs with a NaN are excluded from the numpy fit
+        x_nan = Series([np.nan, 1, 2, 3, 4, 5, 6])
+        y_nan = Series([1.0, 1.8, 2.1, 2.7, 3.2, 4, np.nan])
+        with patch.dict(pandas_ta.Imports, {"sklearn": False}):
+            result = self.utils.linear_regression(x_nan, y_nan)
+        self.assertAlmostEqual(result["a"], 1.11)
+        self.assertAlmostEqual(result["b"], 0.55)
+        self.assertFalse(np.isnan(result["r"]))
+        self.assertEqual(result["line"].size, x_nan.size)
 
     def test_log_geometric_mean(self):
         returns = pandas_ta.percent_return(self.data.close)